@@ -4,14 +4,18 @@
 //! and dynamic watcher restart when include files change during reload.
 
 use crate::kanata::Kanata;
+use crate::oskbd::{KeyEvent, KeyValue};
 use anyhow::Result;
+use kanata_parser::keys::OsCode;
 use notify_debouncer_mini::{
     DebounceEventResult, DebouncedEventKind, new_debouncer, notify::RecursiveMode,
 };
 use parking_lot::Mutex;
+use rustc_hash::FxHashSet;
 use std::fs;
 use std::path::PathBuf;
 use std::sync::Arc;
+use std::sync::mpsc::SyncSender as Sender;
 use std::time::Duration;
 
 /// Discover include files by parsing config files for (include "path") statements.
@@ -57,7 +61,11 @@ pub fn discover_include_files(cfg_paths: &[PathBuf]) -> Vec<PathBuf> {
 
 /// Start comprehensive file watching for configuration files and included files.
 /// This replaces the basic file watcher with full include file support and dynamic restart.
-pub fn start_file_watcher(kanata_arc: Arc<Mutex<Kanata>>) -> Result<()> {
+/// The wakeup channel is used to wake the processing loop after a reload is requested.
+pub fn start_file_watcher(
+    kanata_arc: Arc<Mutex<Kanata>>,
+    wakeup_channel: Sender<KeyEvent>,
+) -> Result<()> {
     // Get paths from kanata
     let cfg_paths = {
         let k = kanata_arc.lock();
@@ -69,10 +77,16 @@ pub fn start_file_watcher(kanata_arc: Arc<Mutex<Kanata>>) -> Result<()> {
     {
         let mut k = kanata_arc.lock();
         k.included_files = included_files.clone();
+        k.file_watcher_wakeup_channel = Some(wakeup_channel.clone());
     }
 
     // Create the watcher and store it in the Kanata struct
-    let debouncer = create_debouncer(kanata_arc.clone(), &cfg_paths, &included_files)?;
+    let debouncer = create_debouncer(
+        kanata_arc.clone(),
+        &cfg_paths,
+        &included_files,
+        Some(wakeup_channel),
+    )?;
 
     // Store the debouncer in the Kanata struct
     {
@@ -89,12 +103,26 @@ pub fn create_debouncer(
     kanata_arc: Arc<Mutex<Kanata>>,
     cfg_paths: &[PathBuf],
     included_files: &[PathBuf],
+    wakeup_channel: Option<Sender<KeyEvent>>,
 ) -> Result<notify_debouncer_mini::Debouncer<notify_debouncer_mini::notify::RecommendedWatcher>> {
-    // Create list of all files to watch
-    let all_watched_files: Vec<PathBuf> = cfg_paths
+    // Canonicalize the watched files once up front so that each event only needs to
+    // canonicalize its own path before a set lookup.
+    let all_watched_files: FxHashSet<PathBuf> = cfg_paths
         .iter()
         .chain(included_files.iter())
-        .cloned()
+        .map(|path| path.canonicalize().unwrap_or_else(|_| path.clone()))
+        .collect();
+
+    // Watch the directories containing the files rather than the files themselves. Editors
+    // that save by writing a temporary file and renaming it over the original replace the
+    // file's inode, which silently detaches a watch placed on the file. Events for unrelated
+    // files in these directories are filtered out by the set lookup in the event handler.
+    let watched_dirs: FxHashSet<PathBuf> = all_watched_files
+        .iter()
+        .map(|path| match path.parent() {
+            Some(parent) if !parent.as_os_str().is_empty() => parent.to_path_buf(),
+            _ => PathBuf::from("."),
+        })
         .collect();
 
     // Create debouncer with 500ms timeout and event handling closure
@@ -106,10 +134,11 @@ pub fn create_debouncer(
                 Ok(events) => {
                     for event in events {
                         // Check if the changed file is one of our watched files
-                        if all_watched_files.iter().any(|watched_path| {
-                            event.path.canonicalize().unwrap_or(event.path.clone())
-                                == watched_path.canonicalize().unwrap_or(watched_path.clone())
-                        }) {
+                        let event_path = event
+                            .path
+                            .canonicalize()
+                            .unwrap_or_else(|_| event.path.clone());
+                        if all_watched_files.contains(&event_path) {
                             match event.kind {
                                 DebouncedEventKind::Any => {
                                     log::info!(
@@ -120,6 +149,16 @@ pub fn create_debouncer(
                                     // Set the live_reload_requested flag
                                     if let Some(mut kanata) = kanata_arc_clone.try_lock() {
                                         kanata.request_live_reload();
+                                        drop(kanata);
+                                        // The processing loop may be blocked waiting for input.
+                                        // A full channel means it is busy and will see the flag
+                                        // on its next iteration anyway.
+                                        if let Some(wakeup_channel) = &wakeup_channel {
+                                            let _ = wakeup_channel.try_send(KeyEvent {
+                                                code: OsCode::KEY_RESERVED,
+                                                value: KeyValue::WakeUp,
+                                            });
+                                        }
                                     } else {
                                         log::warn!(
                                             "Could not acquire lock to set live_reload_requested"
@@ -144,19 +183,16 @@ pub fn create_debouncer(
         },
     )?;
 
-    // Watch all config files
-    for path in cfg_paths {
+    for dir in &watched_dirs {
         debouncer
             .watcher()
-            .watch(path, RecursiveMode::NonRecursive)?;
+            .watch(dir, RecursiveMode::NonRecursive)?;
+        log::debug!("Watching directory for changes: {}", dir.display());
+    }
+    for path in cfg_paths {
         log::info!("Watching config file for changes: {}", path.display());
     }
-
-    // Watch included files
     for path in included_files {
-        debouncer
-            .watcher()
-            .watch(path, RecursiveMode::NonRecursive)?;
         log::info!("Watching included file for changes: {}", path.display());
     }
 
@@ -171,8 +207,12 @@ pub fn restart_watcher(k_locked: &mut parking_lot::MutexGuard<Kanata>, k_ref: Ar
     k_locked.file_watcher = None;
 
     // Create a new watcher with the updated file list
-    let new_debouncer = match create_debouncer(k_ref, &k_locked.cfg_paths, &k_locked.included_files)
-    {
+    let new_debouncer = match create_debouncer(
+        k_ref,
+        &k_locked.cfg_paths,
+        &k_locked.included_files,
+        k_locked.file_watcher_wakeup_channel.clone(),
+    ) {
         Ok(debouncer) => {
             log::info!("File watcher successfully restarted");
             Some(debouncer)
@@ -163,6 +163,10 @@ pub struct Kanata {
     /// Flag to indicate that the file watcher needs to be restarted due to include file changes.
     #[cfg(feature = "watch")]
     pub file_watcher_restart_requested: bool,
+    /// Channel used by the file watcher to wake up the processing loop after it requests a
+    /// live reload, so the reload does not wait for the next key event.
+    #[cfg(feature = "watch")]
+    pub file_watcher_wakeup_channel: Option<Sender<KeyEvent>>,
     #[cfg(target_os = "linux")]
     /// Linux input paths in the user configuration.
     pub kbd_in_paths: Vec<String>,
@@ -419,6 +423,8 @@ impl Kanata {
             live_reload_requested: false,
             #[cfg(feature = "watch")]
             file_watcher_restart_requested: false,
+            #[cfg(feature = "watch")]
+            file_watcher_wakeup_channel: None,
             overrides: cfg.overrides,
             override_states: OverrideStates::new(),
             #[cfg(target_os = "macos")]
@@ -572,6 +578,8 @@ impl Kanata {
             live_reload_requested: false,
             #[cfg(feature = "watch")]
             file_watcher_restart_requested: false,
+            #[cfg(feature = "watch")]
+            file_watcher_wakeup_channel: None,
             overrides: cfg.overrides,
             override_states: OverrideStates::new(),
             #[cfg(target_os = "macos")]
@@ -2170,21 +2178,7 @@ impl Kanata {
                             k.last_tick = now;
 
                             // Check for live reload BEFORE processing the key event
-                            if k.live_reload_requested
-                                && ((k.prev_keys.is_empty() && k.cur_keys.is_empty())
-                                    || k.ticks_since_idle > 1000)
-                            {
-                                k.live_reload_requested = false;
-                                if let Err(e) = k.do_live_reload(&tx) {
-                                    log::error!("live reload failed {e}");
-                                }
-                            }
-
-                            // Handle file watcher restart if needed
-                            #[cfg(feature = "watch")]
-                            if k.file_watcher_restart_requested {
-                                crate::file_watcher::restart_watcher(&mut k, kanata.clone());
-                            }
+                            handle_pending_reload(&mut k, &kanata, &tx);
 
                             #[cfg(feature = "perf_logging")]
                             let start = web_time::Instant::now();
@@ -2236,21 +2230,7 @@ impl Kanata {
                     match rx.try_recv() {
                         Ok(kev) => {
                             // Check for live reload BEFORE processing the key event
-                            if k.live_reload_requested
-                                && ((k.prev_keys.is_empty() && k.cur_keys.is_empty())
-                                    || k.ticks_since_idle > 1000)
-                            {
-                                k.live_reload_requested = false;
-                                if let Err(e) = k.do_live_reload(&tx) {
-                                    log::error!("live reload failed {e}");
-                                }
-                            }
-
-                            // Handle file watcher restart if needed
-                            #[cfg(feature = "watch")]
-                            if k.file_watcher_restart_requested {
-                                crate::file_watcher::restart_watcher(&mut k, kanata.clone());
-                            }
+                            handle_pending_reload(&mut k, &kanata, &tx);
 
                             #[cfg(feature = "perf_logging")]
                             let start = web_time::Instant::now();
@@ -2503,6 +2483,28 @@ fn apply_speed_modifiers() {
     assert_eq!(apply_mouse_distance_modifiers(10, &vec![33u16, 200u16]), 6);
 }
 
+/// Performs a requested live reload if no keys are held, then restarts the file watcher if the
+/// reload changed the set of included files. Called before processing each input event.
+fn handle_pending_reload(
+    k: &mut parking_lot::MutexGuard<Kanata>,
+    _kanata: &Arc<Mutex<Kanata>>,
+    tx: &Option<Sender<ServerMessage>>,
+) {
+    if k.live_reload_requested
+        && ((k.prev_keys.is_empty() && k.cur_keys.is_empty()) || k.ticks_since_idle > 1000)
+    {
+        k.live_reload_requested = false;
+        if let Err(e) = k.do_live_reload(tx) {
+            log::error!("live reload failed {e}");
+        }
+    }
+
+    #[cfg(feature = "watch")]
+    if k.file_watcher_restart_requested {
+        crate::file_watcher::restart_watcher(k, _kanata.clone());
+    }
+}
+
 #[cfg(feature = "passthru_ahk")]
 /// Clean kanata's state without exiting
 pub fn clean_state(kanata: &Arc<Mutex<Kanata>>, tick: u128) -> Result<()> {
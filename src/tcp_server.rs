@@ -13,7 +13,7 @@ type HashMap<K, V> = rustc_hash::FxHashMap<K, V>;
 #[cfg(feature = "tcp_server")]
 use kanata_parser::cfg::SimpleSExpr;
 #[cfg(feature = "tcp_server")]
-use std::io::Write;
+use std::io::{BufReader, Write};
 #[cfg(feature = "tcp_server")]
 use std::net::{TcpListener, TcpStream};
 
@@ -93,12 +93,18 @@ impl TcpServer {
             for stream in listener.incoming() {
                 match stream {
                     Ok(mut stream) => {
+                        // Responses are small newline-terminated JSON messages that are each
+                        // written with a single write_all; don't let Nagle hold them back
+                        // waiting for the client's ACK.
+                        if let Err(e) = stream.set_nodelay(true) {
+                            log::warn!("failed to set TCP_NODELAY on client stream: {e:?}");
+                        }
                         {
                             let k = kanata.lock();
                             log::info!(
                                 "new client connection, sending initial LayerChange event to inform them of current layer"
                             );
-                            if let Err(e) = stream.write(
+                            if let Err(e) = stream.write_all(
                                 &ServerMessage::LayerChange {
                                     new: k.layer_info[k.layout.b().current_layer()].name.clone(),
                                 }
@@ -118,9 +124,11 @@ impl TcpServer {
                             addr.clone(),
                             stream.try_clone().expect("stream is clonable"),
                         );
-                        let reader = serde_json::Deserializer::from_reader(
+                        // serde_json does not buffer its input and would otherwise issue a
+                        // read syscall per byte of every incoming message.
+                        let reader = serde_json::Deserializer::from_reader(BufReader::new(
                             stream.try_clone().expect("stream is clonable"),
-                        )
+                        ))
                         .into_iter::<ClientMessage>();
 
                         log::info!("listening for incoming messages {addr}");